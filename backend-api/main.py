@@ -1,11 +1,60 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import functools
 import httpx
 import asyncio
+import msgspec
+import os
+import redis.asyncio as aioredis
+import time
 
-app = FastAPI(title="Travel Data Aggregator API", version="1.0.0")
+from travel_tips import generate_travel_tips, get_best_time_to_visit
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP/2 client for the app's lifetime, so upstream connections
+    # are kept alive and reused instead of re-handshaking on every request
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+    )
+    # Optional Redis cache shared by all workers, on top of the in-process caches
+    app.state.redis = (
+        aioredis.from_url(REDIS_URL, socket_connect_timeout=0.25, socket_timeout=0.25)
+        if REDIS_URL
+        else None
+    )
+    app.state.destinations = None
+    app.state.destinations_by_code = {}
+    app.state.destinations_by_folded_name = {}
+    app.state.destination_names = []
+    try:
+        # Prefetch the popular destinations once; if the upstream is down the
+        # first request to need them retries the fetch
+        try:
+            await ensure_destinations()
+        except HTTPException:
+            pass
+        yield
+    finally:
+        await app.state.http.aclose()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
+
+app = FastAPI(
+    title="Travel Data Aggregator API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,7 +65,12 @@ app.add_middleware(
 )
 
 # Models
+# Response models are frozen because cached instances are shared across
+# requests, and are built from already-coerced upstream data with
+# model_construct(). Request bodies are validated as usual.
 class Destination(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     country_code: str
     country_name: str
     capital: str
@@ -26,6 +80,8 @@ class Destination(BaseModel):
     languages: List[str]
 
 class Weather(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     location: str
     temperature_celsius: float
     weather_description: str
@@ -33,6 +89,8 @@ class Weather(BaseModel):
     wind_speed_kmh: float
 
 class TravelSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     country_code: str
     country_name: str
     capital: str
@@ -50,15 +108,187 @@ class TravelRequest(BaseModel):
 class TravelByNameRequest(BaseModel):
     country_name: str
 
+class TravelBatchRequest(BaseModel):
+    country_codes: List[str]
+
 class CountryCodeResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     country_code: str
     country_name: str
 
+# Upstream records, decoded straight from the response bytes by msgspec.
+# Only the fields we use are declared; everything else is skipped while decoding.
+class CountryName(msgspec.Struct, frozen=True):
+    common: str = "Unknown"
+
+class CountryRecord(msgspec.Struct, frozen=True):
+    cca2: str = ""
+    name: Optional[CountryName] = None
+    capital: List[str] = []
+    region: str = "Unknown"
+    population: int = 0
+    # Only the currency codes are used, so the per-currency details stay raw
+    currencies: Dict[str, msgspec.Raw] = {}
+    languages: Dict[str, str] = {}
+
+class GeocodingResult(msgspec.Struct, frozen=True):
+    latitude: float
+    longitude: float
+
+class GeocodingResponse(msgspec.Struct, frozen=True):
+    results: List[GeocodingResult] = []
+
+class CurrentConditions(msgspec.Struct, frozen=True):
+    temperature_2m: float = 0.0
+    relative_humidity_2m: int = 0
+    weather_code: int = 0
+    wind_speed_10m: float = 0.0
+
+class Forecast(msgspec.Struct, frozen=True):
+    current: CurrentConditions = msgspec.field(default_factory=CurrentConditions)
+
+COUNTRY_LIST_DECODER = msgspec.json.Decoder(List[CountryRecord])
+COUNTRY_DECODER = msgspec.json.Decoder(Union[List[CountryRecord], CountryRecord])
+GEOCODING_DECODER = msgspec.json.Decoder(GeocodingResponse)
+FORECAST_DECODER = msgspec.json.Decoder(Union[List[Forecast], Forecast])
+
+# Response serializers. Routes return bytes encoded with these so FastAPI does
+# not dump and re-validate our own models against response_model, which stays
+# on each route for the OpenAPI schema.
+DESTINATION_ADAPTER = TypeAdapter(Destination)
+DESTINATION_LIST_ADAPTER = TypeAdapter(List[Destination])
+COUNTRY_CODE_ADAPTER = TypeAdapter(CountryCodeResponse)
+TRAVEL_SUMMARY_ADAPTER = TypeAdapter(TravelSummary)
+TRAVEL_SUMMARY_LIST_ADAPTER = TypeAdapter(List[TravelSummary])
+
 # Public API endpoints (no API keys required)
 REST_COUNTRIES_API = "https://restcountries.com/v3.1"
 OPEN_METEO_API = "https://api.open-meteo.com/v1"
 GEOCODING_API = "https://geocoding-api.open-meteo.com/v1"
 
+# Ask REST Countries for just the fields CountryRecord declares
+COUNTRY_FIELDS = ",".join(CountryRecord.__struct_fields__)
+
+# Countries listed by /destinations and searched by name
+POPULAR_CODES = ["JP", "FR", "IT", "ES", "TH", "AU", "GB", "DE", "NZ", "CA"]
+
+# Capital city coordinates for the popular destinations, so their summaries
+# skip the geocoding call entirely
+POPULAR_COORDS: Dict[str, Tuple[float, float]] = {
+    "JP": (35.6762, 139.6503),   # Tokyo
+    "FR": (48.8566, 2.3522),     # Paris
+    "IT": (41.9028, 12.4964),    # Rome
+    "ES": (40.4168, -3.7038),    # Madrid
+    "TH": (13.7563, 100.5018),   # Bangkok
+    "AU": (-35.2809, 149.1300),  # Canberra
+    "GB": (51.5074, -0.1278),    # London
+    "DE": (52.5200, 13.4050),    # Berlin
+    "NZ": (-41.2865, 174.7762),  # Wellington
+    "CA": (45.4215, -75.6972)    # Ottawa
+}
+
+# Upper bound on countries accepted by /travel-summary/batch
+MAX_BATCH_SIZE = 25
+
+# Cache lifetimes (seconds) for upstream data; None means never expire
+COUNTRY_CACHE_TTL = 86400
+GEOCODING_CACHE_TTL = None
+SUMMARY_CACHE_TTL = 900
+
+# Set to e.g. redis://localhost:6379/0 to share cached lookups across workers
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_KEY_PREFIX = "travel"
+
+# Lookup table for Open-Meteo weather codes
+WEATHER_CODES = {
+    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Foggy", 48: "Depositing rime fog", 51: "Light drizzle", 53: "Moderate drizzle",
+    55: "Dense drizzle", 61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+    71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow", 80: "Slight rain showers",
+    81: "Moderate rain showers", 82: "Violent rain showers", 95: "Thunderstorm"
+}
+
+
+def async_ttl_cache(
+    ttl: Optional[float] = None,
+    maxsize: int = 512,
+    key: Optional[Callable[..., Any]] = None,
+    namespace: Optional[str] = None,
+    adapter: Optional[TypeAdapter] = None,
+):
+    """
+    Cache the results of an async function in memory.
+    Entries expire after `ttl` seconds (never if None) and the least recently
+    used entry is evicted once `maxsize` is reached. Exceptions and None
+    results are not cached, so upstream failures are retried on the next call.
+    
+    When `namespace` and `adapter` are given and REDIS_URL is set, results are
+    also stored in Redis (serialized with the pydantic TypeAdapter) so other
+    workers can reuse them. Values read from Redis expire locally when the
+    Redis key does, so a shared entry never outlives `ttl`. Redis errors fall
+    back to calling the function, and entries that no longer decode are
+    treated as a miss and deleted.
+    """
+    def decorator(func):
+        cache: "OrderedDict[Any, Tuple[Optional[float], Any]]" = OrderedDict()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    cache.move_to_end(cache_key)
+                    return value
+                del cache[cache_key]
+            
+            redis = getattr(app.state, "redis", None) if namespace and adapter else None
+            redis_key = f"{REDIS_KEY_PREFIX}:{namespace}:{cache_key}"
+            value = None
+            lifetime = ttl
+            if redis is not None:
+                try:
+                    async with redis.pipeline(transaction=False) as pipe:
+                        raw, remaining_ms = await pipe.get(redis_key).pttl(redis_key).execute()
+                    if raw is not None:
+                        value = adapter.validate_json(raw)
+                        # Keep the entry only as long as Redis still would, not a fresh ttl
+                        if remaining_ms is not None and remaining_ms >= 0:
+                            lifetime = remaining_ms / 1000
+                except aioredis.RedisError:
+                    pass
+                except ValueError:
+                    # Stale or corrupt entry: treat it as a miss and drop it
+                    try:
+                        await redis.delete(redis_key)
+                    except aioredis.RedisError:
+                        pass
+            
+            if value is None:
+                value = await func(*args, **kwargs)
+                if value is not None and redis is not None:
+                    try:
+                        await redis.set(redis_key, adapter.dump_json(value), ex=ttl)
+                    except aioredis.RedisError:
+                        pass
+            
+            if value is not None:
+                cache[cache_key] = (time.monotonic() + lifetime if lifetime is not None else None, value)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """Encode a response with its module-level TypeAdapter."""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
 
 @app.get("/")
 def read_root():
@@ -72,47 +302,87 @@ def read_root():
         "endpoints": {
             "destinations": "GET /destinations - List popular travel destinations",
             "destination_info": "GET /destinations/{country_code} - Get detailed country info",
-            "travel_summary": "POST /travel-summary - Get aggregated travel summary with weather"
+            "travel_summary": "POST /travel-summary - Get aggregated travel summary with weather",
+            "travel_summary_batch": "POST /travel-summary/batch - Get travel summaries for several countries"
         }
     }
 
 
+def parse_destination(country: CountryRecord) -> Destination:
+    """Build a Destination from a REST Countries API country record."""
+    return Destination.model_construct(
+        country_code=country.cca2,
+        country_name=country.name.common if country.name else "Unknown",
+        capital=country.capital[0] if country.capital else "N/A",
+        region=country.region,
+        population=country.population,
+        currencies=list(country.currencies) if country.currencies else ["N/A"],
+        languages=list(country.languages.values()) if country.languages else ["N/A"]
+    )
+
+
+@async_ttl_cache(
+    ttl=COUNTRY_CACHE_TTL,
+    maxsize=1,
+    key=lambda: "popular",
+    namespace="destinations",
+    adapter=DESTINATION_LIST_ADAPTER,
+)
+async def fetch_destinations() -> List[Destination]:
+    """Fetch the popular destinations from REST Countries API."""
+    client = app.state.http
+    try:
+        response = await client.get(
+            f"{REST_COUNTRIES_API}/alpha",
+            params={"codes": ",".join(POPULAR_CODES), "fields": COUNTRY_FIELDS}
+        )
+        if not response.is_success:
+            raise HTTPException(status_code=503, detail=f"Failed to fetch country data: HTTP {response.status_code}")
+        countries_data = COUNTRY_LIST_DECODER.decode(response.content)
+    except (httpx.RequestError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=503, detail=f"Failed to fetch country data: {str(e)}")
+    
+    return [parse_destination(country) for country in countries_data]
+
+
+async def ensure_destinations() -> List[Destination]:
+    """
+    Return the popular destinations, keeping them on app.state together with
+    lookup indexes by country code and casefolded name, plus (casefolded name,
+    destination) pairs for partial-match searches. fetch_destinations caches
+    the list for COUNTRY_CACHE_TTL, so the indexes are only rebuilt when it
+    hands back a fresh one.
+    """
+    destinations = await fetch_destinations()
+    if destinations is not app.state.destinations:
+        app.state.destinations = destinations
+        app.state.destinations_by_code = {dest.country_code: dest for dest in destinations}
+        app.state.destinations_by_folded_name = {dest.country_name.casefold(): dest for dest in destinations}
+        app.state.destination_names = [(dest.country_name.casefold(), dest) for dest in destinations]
+    return destinations
+
+
+def find_destination(country_name: str) -> Optional[Destination]:
+    """Find a popular destination by name (case-insensitive, exact match first, then partial)."""
+    query = country_name.casefold()
+    match = app.state.destinations_by_folded_name.get(query)
+    if match:
+        return match
+    
+    for name, dest in app.state.destination_names:
+        if query in name or name in query:
+            return dest
+    return None
+
+
 @app.get("/destinations", response_model=List[Destination])
 async def get_destinations():
     """
     Get a list of popular travel destinations.
-    Fetches real data from REST Countries API.
+    Served from the list fetched from REST Countries API at startup,
+    refreshed once it is older than COUNTRY_CACHE_TTL.
     """
-    popular_codes = ["JP", "FR", "IT", "ES", "TH", "AU", "GB", "DE", "NZ", "CA"]
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{REST_COUNTRIES_API}/alpha",
-                params={"codes": ",".join(popular_codes)}
-            )
-            response.raise_for_status()
-            countries_data = response.json()
-        except httpx.HTTPError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to fetch country data: {str(e)}")
-    
-    destinations = []
-    for country in countries_data:
-        currencies = list(country.get("currencies", {}).keys()) if country.get("currencies") else ["N/A"]
-        languages = list(country.get("languages", {}).values()) if country.get("languages") else ["N/A"]
-        capital = country.get("capital", ["N/A"])[0] if country.get("capital") else "N/A"
-        
-        destinations.append(Destination(
-            country_code=country.get("cca2", ""),
-            country_name=country.get("name", {}).get("common", "Unknown"),
-            capital=capital,
-            region=country.get("region", "Unknown"),
-            population=country.get("population", 0),
-            currencies=currencies,
-            languages=languages
-        ))
-    
-    return destinations
+    return json_response(DESTINATION_LIST_ADAPTER, await ensure_destinations())
 
 
 @app.get("/destinations/search", response_model=CountryCodeResponse)
@@ -124,30 +394,34 @@ async def search_destination_by_name(country: str):
     """
     country_name = country
     # Get all destinations
-    destinations = await get_destinations()
+    destinations = await ensure_destinations()
     
     # Find matching country (case-insensitive partial match)
-    for dest in destinations:
-        if country_name.lower() in dest.country_name.lower() or dest.country_name.lower() in country_name.lower():
-            return CountryCodeResponse(
-                country_code=dest.country_code,
-                country_name=dest.country_name
-            )
+    dest = find_destination(country_name)
+    if dest:
+        return json_response(COUNTRY_CODE_ADAPTER, CountryCodeResponse(
+            country_code=dest.country_code,
+            country_name=dest.country_name
+        ))
     
     # If not found in popular destinations, try REST Countries API search
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(f"{REST_COUNTRIES_API}/name/{country_name}")
-            response.raise_for_status()
-            countries = response.json()
-            if countries and len(countries) > 0:
-                country = countries[0]
-                return CountryCodeResponse(
-                    country_code=country.get("cca2", ""),
-                    country_name=country.get("name", {}).get("common", "Unknown")
-                )
-        except httpx.HTTPError:
-            pass
+    client = app.state.http
+    try:
+        response = await client.get(
+            f"{REST_COUNTRIES_API}/name/{country_name}",
+            params={"fields": COUNTRY_FIELDS}
+        )
+        # Unknown names come back as 404; fall through to our own 404 below
+        if response.is_success:
+            countries = COUNTRY_LIST_DECODER.decode(response.content)
+            if countries:
+                record = countries[0]
+                return json_response(COUNTRY_CODE_ADAPTER, CountryCodeResponse(
+                    country_code=record.cca2,
+                    country_name=record.name.common if record.name else "Unknown"
+                ))
+    except (httpx.RequestError, msgspec.DecodeError):
+        pass
     
     raise HTTPException(
         status_code=404,
@@ -161,187 +435,182 @@ async def get_destination_info(country_code: str):
     Get detailed information about a specific destination.
     Fetches real data from REST Countries API.
     """
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(f"{REST_COUNTRIES_API}/alpha/{country_code.upper()}")
-            response.raise_for_status()
-            country_data = response.json()
-            if isinstance(country_data, list):
-                country_data = country_data[0]
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
-            raise HTTPException(status_code=503, detail=f"Failed to fetch country data: {str(e)}")
-        except httpx.HTTPError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to fetch country data: {str(e)}")
-    
-    currencies = list(country_data.get("currencies", {}).keys()) if country_data.get("currencies") else ["N/A"]
-    languages = list(country_data.get("languages", {}).values()) if country_data.get("languages") else ["N/A"]
-    capital = country_data.get("capital", ["N/A"])[0] if country_data.get("capital") else "N/A"
-    
-    return Destination(
-        country_code=country_data.get("cca2", ""),
-        country_name=country_data.get("name", {}).get("common", "Unknown"),
-        capital=capital,
-        region=country_data.get("region", "Unknown"),
-        population=country_data.get("population", 0),
-        currencies=currencies,
-        languages=languages
-    )
+    return json_response(DESTINATION_ADAPTER, await resolve_destination(country_code))
 
 
-async def get_coordinates(city: str, country_code: str) -> tuple:
-    """Get latitude and longitude for a city using Open-Meteo Geocoding API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{GEOCODING_API}/search",
-                params={"name": city, "count": 1, "format": "json"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            if data.get("results"):
-                result = data["results"][0]
-                return result["latitude"], result["longitude"]
-        except httpx.HTTPError:
-            pass
-    return None, None
+async def resolve_destination(country_code: str) -> Destination:
+    """
+    Resolve a country code to a Destination. Popular destinations are answered
+    from the loaded list, others are fetched from REST Countries API.
+    """
+    try:
+        await ensure_destinations()
+    except HTTPException:
+        # The popular list could not be refreshed; look this country up on its own
+        return await fetch_destination(country_code)
+    
+    popular = app.state.destinations_by_code.get(country_code.upper())
+    if popular:
+        return popular
+    return await fetch_destination(country_code)
 
 
-async def get_weather_for_location(lat: float, lon: float, location_name: str) -> Weather:
-    """Get current weather for coordinates using Open-Meteo API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                f"{OPEN_METEO_API}/forecast",
-                params={
-                    "latitude": lat,
-                    "longitude": lon,
-                    "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            current = data.get("current", {})
-            
-            weather_codes = {
-                0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-                45: "Foggy", 48: "Depositing rime fog", 51: "Light drizzle", 53: "Moderate drizzle",
-                55: "Dense drizzle", 61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-                71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow", 80: "Slight rain showers",
-                81: "Moderate rain showers", 82: "Violent rain showers", 95: "Thunderstorm"
-            }
-            weather_code = current.get("weather_code", 0)
-            
-            return Weather(
-                location=location_name,
-                temperature_celsius=current.get("temperature_2m", 0),
-                weather_description=weather_codes.get(weather_code, "Unknown"),
-                humidity=current.get("relative_humidity_2m", 0),
-                wind_speed_kmh=current.get("wind_speed_10m", 0)
-            )
-        except httpx.HTTPError as e:
-            raise HTTPException(status_code=503, detail=f"Failed to fetch weather data: {str(e)}")
+@async_ttl_cache(
+    ttl=COUNTRY_CACHE_TTL,
+    key=lambda country_code: country_code.upper(),
+    namespace="destination",
+    adapter=DESTINATION_ADAPTER,
+)
+async def fetch_destination(country_code: str) -> Destination:
+    """Fetch a single destination from REST Countries API."""
+    client = app.state.http
+    try:
+        response = await client.get(
+            f"{REST_COUNTRIES_API}/alpha/{country_code.upper()}",
+            params={"fields": COUNTRY_FIELDS}
+        )
+        if response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+        if not response.is_success:
+            raise HTTPException(status_code=503, detail=f"Failed to fetch country data: HTTP {response.status_code}")
+        country_data = COUNTRY_DECODER.decode(response.content)
+    except (httpx.RequestError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=503, detail=f"Failed to fetch country data: {str(e)}")
+    
+    if isinstance(country_data, list):
+        if not country_data:
+            raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
+        country_data = country_data[0]
+    
+    return parse_destination(country_data)
 
 
-def generate_travel_tips(country_name: str, region: str, weather: Weather) -> List[str]:
-    """Generate travel tips based on destination and weather."""
-    tips = []
-    
-    if weather.temperature_celsius > 30:
-        tips.append("Pack light, breathable clothing - it's hot!")
-        tips.append("Stay hydrated and use sunscreen")
-    elif weather.temperature_celsius < 10:
-        tips.append("Bring warm layers - it's cold!")
-        tips.append("Pack a good jacket and warm accessories")
-    else:
-        tips.append("Weather is mild - pack versatile clothing")
-    
-    if "rain" in weather.weather_description.lower() or "drizzle" in weather.weather_description.lower():
-        tips.append("Bring an umbrella or rain jacket")
-    
-    region_tips = {
-        "Europe": "Consider getting a travel adapter for EU plugs",
-        "Asia": "Learn a few local phrases - it's appreciated!",
-        "Oceania": "Don't forget reef-safe sunscreen for beach visits",
-        "Americas": "Check visa requirements before traveling",
-        "Africa": "Consult a travel health clinic for vaccinations"
-    }
-    if region in region_tips:
-        tips.append(region_tips[region])
-    
-    tips.append(f"Research local customs and etiquette for {country_name}")
-    
-    return tips
-
-
-def get_best_time_to_visit(region: str, country_code: str) -> str:
-    """Get best time to visit based on region."""
-    best_times = {
-        "JP": "March-May (cherry blossoms) or October-November (autumn colors)",
-        "FR": "April-June or September-October for mild weather",
-        "IT": "April-June or September-October to avoid crowds",
-        "ES": "March-May or September-November for pleasant weather",
-        "TH": "November-February (cool and dry season)",
-        "AU": "September-November (spring) or March-May (autumn)",
-        "GB": "May-September for warmer weather",
-        "DE": "May-September for outdoor activities",
-        "NZ": "December-February (summer) for best weather",
-        "CA": "June-August for summer, December-March for skiing"
-    }
-    return best_times.get(country_code, f"Research the best season for {region}")
+@async_ttl_cache(
+    ttl=GEOCODING_CACHE_TTL,
+    key=lambda city, country_code: f"{city.lower()}:{country_code.upper()}",
+    namespace="coordinates",
+    adapter=TypeAdapter(Tuple[float, float]),
+)
+async def get_coordinates(city: str, country_code: str) -> Optional[Tuple[float, float]]:
+    """
+    Get latitude and longitude for a city using Open-Meteo Geocoding API.
+    Returns None if the city could not be geocoded.
+    """
+    client = app.state.http
+    try:
+        response = await client.get(
+            f"{GEOCODING_API}/search",
+            params={"name": city, "count": 1, "format": "json"}
+        )
+        if response.is_success:
+            data = GEOCODING_DECODER.decode(response.content)
+            if data.results:
+                result = data.results[0]
+                return result.latitude, result.longitude
+    except (httpx.RequestError, msgspec.DecodeError):
+        pass
+    return None
 
 
-@app.post("/travel-summary-by-name", response_model=TravelSummary)
-async def get_travel_summary_by_name(request: TravelByNameRequest):
+async def get_capital_coordinates(destination: Destination) -> Optional[Tuple[float, float]]:
     """
-    Get a comprehensive travel summary for a destination by country name.
-    First searches for the country in the destinations list to get the code,
-    then aggregates data from REST Countries API and Open-Meteo Weather API.
-    Returns country info, current weather, and travel tips.
+    Get coordinates for a destination's capital city, answering the popular
+    destinations from POPULAR_COORDS before falling back to geocoding.
     """
-    country_name = request.country_name.strip()
-    
-    # Get all destinations to search for the country
-    destinations = await get_destinations()
-    
-    # Find matching country (case-insensitive partial match)
-    matching_country = None
-    for dest in destinations:
-        if country_name.lower() in dest.country_name.lower() or dest.country_name.lower() in country_name.lower():
-            matching_country = dest
-            break
-    
-    if not matching_country:
+    coordinates = POPULAR_COORDS.get(destination.country_code)
+    if coordinates:
+        return coordinates
+    return await get_coordinates(destination.capital, destination.country_code)
+
+
+def parse_weather(forecast: Forecast, location_name: str) -> Weather:
+    """Build a Weather from an Open-Meteo API forecast record."""
+    current = forecast.current
+    
+    return Weather.model_construct(
+        location=location_name,
+        temperature_celsius=current.temperature_2m,
+        weather_description=WEATHER_CODES.get(current.weather_code, "Unknown"),
+        humidity=current.relative_humidity_2m,
+        wind_speed_kmh=current.wind_speed_10m
+    )
+
+
+async def get_weather_for_locations(locations: List[Tuple[float, float, str]]) -> List[Weather]:
+    """
+    Get current weather for several (lat, lon, location_name) points using a
+    single Open-Meteo API call, which accepts comma-separated coordinates.
+    """
+    client = app.state.http
+    try:
+        response = await client.get(
+            f"{OPEN_METEO_API}/forecast",
+            params={
+                "latitude": ",".join(str(lat) for lat, _, _ in locations),
+                "longitude": ",".join(str(lon) for _, lon, _ in locations),
+                "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m"
+            }
+        )
+        if not response.is_success:
+            raise HTTPException(status_code=503, detail=f"Failed to fetch weather data: HTTP {response.status_code}")
+        data = FORECAST_DECODER.decode(response.content)
+    except (httpx.RequestError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=503, detail=f"Failed to fetch weather data: {str(e)}")
+    
+    # A single location comes back as an object, several as a list in request order
+    forecasts = data if isinstance(data, list) else [data]
+    if len(forecasts) != len(locations):
         raise HTTPException(
-            status_code=404, 
-            detail=f"Country '{country_name}' not found in destinations. Available countries: {', '.join([d.country_name for d in destinations[:5]])}..."
+            status_code=503,
+            detail=f"Failed to fetch weather data: expected {len(locations)} forecasts, got {len(forecasts)}"
         )
-    
-    country_code = matching_country.country_code
-    
-    # Fetch country information
-    destination = await get_destination_info(country_code)
-    
+    return [parse_weather(forecast, name) for forecast, (_, _, name) in zip(forecasts, locations)]
+
+
+async def get_weather_for_location(lat: float, lon: float, location_name: str) -> Weather:
+    """Get current weather for coordinates using Open-Meteo API."""
+    weather = await get_weather_for_locations([(lat, lon, location_name)])
+    return weather[0]
+
+
+@async_ttl_cache(
+    ttl=SUMMARY_CACHE_TTL,
+    key=lambda destination: destination.country_code,
+    namespace="summary",
+    adapter=TRAVEL_SUMMARY_ADAPTER,
+)
+async def build_travel_summary(destination: Destination) -> TravelSummary:
+    """Aggregate weather, tips and best time to visit for a resolved destination."""
     # Get coordinates for the capital city
-    lat, lon = await get_coordinates(destination.capital, country_code)
+    coordinates = await get_capital_coordinates(destination)
     
-    if lat is None or lon is None:
+    if coordinates is None:
         raise HTTPException(
             status_code=503, 
             detail=f"Could not find coordinates for {destination.capital}"
         )
+    lat, lon = coordinates
     
     # Fetch weather data
     weather = await get_weather_for_location(lat, lon, destination.capital)
     
+    return create_travel_summary(destination, weather)
+
+
+def create_travel_summary(destination: Destination, weather: Weather) -> TravelSummary:
+    """Combine destination info and current weather into a TravelSummary."""
     # Generate travel tips
-    tips = generate_travel_tips(destination.country_name, destination.region, weather)
+    tips = generate_travel_tips(
+        destination.country_name,
+        destination.region,
+        weather.temperature_celsius,
+        weather.weather_description
+    )
     
     # Get best time to visit
-    best_time = get_best_time_to_visit(destination.region, country_code)
+    best_time = get_best_time_to_visit(destination.region, destination.country_code)
     
-    return TravelSummary(
+    return TravelSummary.model_construct(
         country_code=destination.country_code,
         country_name=destination.country_name,
         capital=destination.capital,
@@ -355,6 +624,33 @@ async def get_travel_summary_by_name(request: TravelByNameRequest):
     )
 
 
+@app.post("/travel-summary-by-name", response_model=TravelSummary)
+async def get_travel_summary_by_name(request: TravelByNameRequest):
+    """
+    Get a comprehensive travel summary for a destination by country name.
+    First searches for the country in the destinations list to get the code,
+    then aggregates data from REST Countries API and Open-Meteo Weather API.
+    Returns country info, current weather, and travel tips.
+    """
+    country_name = request.country_name.strip()
+    
+    # Get all destinations to search for the country
+    destinations = await ensure_destinations()
+    
+    # Find matching country (case-insensitive partial match)
+    matching_country = find_destination(country_name)
+    
+    if not matching_country:
+        raise HTTPException(
+            status_code=404, 
+            detail=f"Country '{country_name}' not found in destinations. Available countries: {', '.join([d.country_name for d in destinations[:5]])}..."
+        )
+    
+    # The destinations list already carries every field resolve_destination
+    # would return, so reuse the match instead of re-fetching it
+    return json_response(TRAVEL_SUMMARY_ADAPTER, await build_travel_summary(matching_country))
+
+
 @app.post("/travel-summary", response_model=TravelSummary)
 async def get_travel_summary(request: TravelRequest):
     """
@@ -368,40 +664,61 @@ async def get_travel_summary(request: TravelRequest):
     country_code = request.country_code.upper()
     
     # Fetch country information
-    destination = await get_destination_info(country_code)
-    
-    # Get coordinates for the capital city
-    lat, lon = await get_coordinates(destination.capital, country_code)
-    
-    if lat is None or lon is None:
-        raise HTTPException(
-            status_code=503, 
-            detail=f"Could not find coordinates for {destination.capital}"
-        )
-    
-    # Fetch weather data
-    weather = await get_weather_for_location(lat, lon, destination.capital)
+    destination = await resolve_destination(country_code)
     
-    # Generate travel tips
-    tips = generate_travel_tips(destination.country_name, destination.region, weather)
+    return json_response(TRAVEL_SUMMARY_ADAPTER, await build_travel_summary(destination))
+
+
+@app.post("/travel-summary/batch", response_model=List[TravelSummary])
+async def get_travel_summary_batch(request: TravelBatchRequest):
+    """
+    Get travel summaries for several destinations in one request.
+    Country info and capital coordinates are fetched concurrently, then the
+    weather for every capital comes from a single Open-Meteo API call.
+    Returns summaries in the order the country codes were given.
+    """
+    if not request.country_codes:
+        raise HTTPException(status_code=400, detail="country_codes is required")
+    if len(request.country_codes) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} country codes per request")
+    
+    # Refresh the popular list once here rather than from every lookup below
+    try:
+        await ensure_destinations()
+    except HTTPException:
+        pass
+    
+    # Fetch country information for every code at once
+    destinations = await asyncio.gather(*(resolve_destination(code) for code in request.country_codes))
+    
+    # Get coordinates for every capital city at once
+    coordinates = await asyncio.gather(*(get_capital_coordinates(destination) for destination in destinations))
+    
+    locations = []
+    for destination, coords in zip(destinations, coordinates):
+        if coords is None:
+            raise HTTPException(
+                status_code=503, 
+                detail=f"Could not find coordinates for {destination.capital}"
+            )
+        locations.append((coords[0], coords[1], destination.capital))
     
-    # Get best time to visit
-    best_time = get_best_time_to_visit(destination.region, country_code)
+    # Fetch weather for all capitals in one call
+    weathers = await get_weather_for_locations(locations)
     
-    return TravelSummary(
-        country_code=destination.country_code,
-        country_name=destination.country_name,
-        capital=destination.capital,
-        region=destination.region,
-        population=destination.population,
-        currencies=destination.currencies,
-        languages=destination.languages,
-        current_weather=weather,
-        travel_tips=tips,
-        best_time_to_visit=best_time
-    )
+    summaries = [create_travel_summary(destination, weather) for destination, weather in zip(destinations, weathers)]
+    return json_response(TRAVEL_SUMMARY_LIST_ADAPTER, summaries)
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # One worker per CPU on uvloop + httptools (both installed by uvicorn[standard]).
+    # Workers require the app as an import string, so run this from backend-api/.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=os.cpu_count() or 1,
+        loop="uvloop",
+        http="httptools",
+    )
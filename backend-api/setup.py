@@ -0,0 +1,16 @@
+"""
+Optional build script that compiles travel_tips.py with mypyc.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+See "Compiling Hot Helpers" in README.md.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="travel-summary-api",
+    py_modules=["travel_tips"],
+    ext_modules=mypycify(["travel_tips.py"]),
+)
@@ -0,0 +1,60 @@
+"""
+Per-request travel advice helpers.
+
+Kept free of FastAPI/Pydantic types and fully annotated so this module can be
+compiled with mypyc (see "Compiling Hot Helpers" in README.md). main.py imports
+it the same way whether it is compiled or not.
+"""
+from typing import Dict, List
+
+REGION_TIPS: Dict[str, str] = {
+    "Europe": "Consider getting a travel adapter for EU plugs",
+    "Asia": "Learn a few local phrases - it's appreciated!",
+    "Oceania": "Don't forget reef-safe sunscreen for beach visits",
+    "Americas": "Check visa requirements before traveling",
+    "Africa": "Consult a travel health clinic for vaccinations"
+}
+
+BEST_TIMES: Dict[str, str] = {
+    "JP": "March-May (cherry blossoms) or October-November (autumn colors)",
+    "FR": "April-June or September-October for mild weather",
+    "IT": "April-June or September-October to avoid crowds",
+    "ES": "March-May or September-November for pleasant weather",
+    "TH": "November-February (cool and dry season)",
+    "AU": "September-November (spring) or March-May (autumn)",
+    "GB": "May-September for warmer weather",
+    "DE": "May-September for outdoor activities",
+    "NZ": "December-February (summer) for best weather",
+    "CA": "June-August for summer, December-March for skiing"
+}
+
+
+def generate_travel_tips(country_name: str, region: str, temperature_celsius: float, weather_description: str) -> List[str]:
+    """Generate travel tips based on destination and weather."""
+    tips: List[str] = []
+
+    if temperature_celsius > 30:
+        tips.append("Pack light, breathable clothing - it's hot!")
+        tips.append("Stay hydrated and use sunscreen")
+    elif temperature_celsius < 10:
+        tips.append("Bring warm layers - it's cold!")
+        tips.append("Pack a good jacket and warm accessories")
+    else:
+        tips.append("Weather is mild - pack versatile clothing")
+
+    description = weather_description.lower()
+    if "rain" in description or "drizzle" in description:
+        tips.append("Bring an umbrella or rain jacket")
+
+    region_tip = REGION_TIPS.get(region)
+    if region_tip:
+        tips.append(region_tip)
+
+    tips.append(f"Research local customs and etiquette for {country_name}")
+
+    return tips
+
+
+def get_best_time_to_visit(region: str, country_code: str) -> str:
+    """Get best time to visit based on region."""
+    return BEST_TIMES.get(country_code, f"Research the best season for {region}")